@@ -0,0 +1,59 @@
+"""
+Opt-in build that compiles the buffer code that encodes and decodes frames with mypyc. This is
+separate from the normal poetry-core build, which always produces a pure-Python wheel.
+
+Run it from the project root, with mypy, setuptools, and wheel installed::
+
+    $ python build_mypyc.py bdist_wheel          # a compiled, platform-specific wheel in dist/
+    $ python build_mypyc.py build_ext --inplace  # compiles into this checkout
+
+If there's no compiled module for the running interpreter, the pure-Python
+``serena.utils.buffer`` is used as normal.
+"""
+
+import tomllib
+from pathlib import Path
+from typing import Any
+
+from mypyc.build import mypycify
+from setuptools import find_packages, setup
+
+#: The modules that get compiled. These are plain, fully annotated Python that doesn't generate
+#: code at runtime, unlike the payload codecs.
+COMPILED_MODULES = ["src/serena/utils/buffer.py"]
+
+
+def _requirement(name: str, spec: str | dict[str, Any]) -> str:
+    if isinstance(spec, dict):
+        spec = spec["version"]
+
+    return f"{name}{spec}"
+
+
+def main() -> None:
+    """
+    Builds the package with the compiled modules, using the metadata from ``pyproject.toml``.
+    """
+
+    project = tomllib.loads(Path("pyproject.toml").read_text())["tool"]["poetry"]
+    dependencies = dict(project["dependencies"])
+    python = dependencies.pop("python")
+
+    setup(
+        name=project["name"],
+        version=project["version"],
+        description=project["description"],
+        license=project["license"],
+        classifiers=project["classifiers"],
+        python_requires=python,
+        install_requires=[_requirement(name, spec) for name, spec in dependencies.items()],
+        package_dir={"": "src"},
+        packages=find_packages("src"),
+        package_data={"serena": ["py.typed"]},
+        # only the compiled modules need to type check cleanly, not everything they import
+        ext_modules=mypycify(["--follow-imports=silent", *COMPILED_MODULES], opt_level="3"),
+    )
+
+
+if __name__ == "__main__":
+    main()
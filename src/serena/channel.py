@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Iterable, Mapping
 from contextlib import aclosing, asynccontextmanager
 from functools import partial
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Final,
     Self,
     TypeVar,
     cast,
@@ -13,9 +15,10 @@ from typing import (
 
 import anyio
 import outcome
-from anyio import CancelScope, ClosedResourceError, EndOfStream, Event, Lock
+from anyio import CancelScope, ClosedResourceError, EndOfStream, Event, Lock, WouldBlock
 from anyio.abc import TaskStatus
 from anyio.lowlevel import checkpoint
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from outcome import Error, Value
 from typing_extensions import override
 
@@ -75,12 +78,46 @@ logger: LoggerWithTrace = LoggerWithTrace.get(__name__)
 
 PayloadType = TypeVar("PayloadType", bound=MethodPayload)
 
+# shared defaults for optional method arguments, so that calls without them don't allocate. these
+# are only ever encoded, and the arguments are read-only so nothing can change them for every call.
+_NO_ARGUMENTS: Final[Mapping[str, Any]] = MappingProxyType({})
+_DEFAULT_HEADER = BasicHeader()
+
+# payloads sent by the server to confirm, or not, a published message
+_CONFIRM_PAYLOADS = (BasicAckPayload, BasicNackPayload, BasicReturnPayload)
+
+#: The maximum number of encoded ``Basic.Publish`` method frames cached per channel.
+_PUBLISH_FRAME_CACHE_SIZE = 128
+
 
 class Channel(ChannelLike):
     """
     A wrapper around an AMQP channel.
     """
 
+    __slots__ = (
+        "_channel_id",
+        "_close_event",
+        "_close_info",
+        "_closed",
+        "_confirm_sink",
+        "_connection",
+        "_delivery_receive",
+        "_delivery_send",
+        "_is_consuming",
+        "_lock",
+        "_message_counter",
+        "_open",
+        "_publish_confirm_sink",
+        "_publish_confirms",
+        "_publish_frames",
+        "_receive",
+        "_returned_body_left",
+        "_send",
+        "_server_flow_stopped",
+        "_skipping_returned",
+    )
+
     def __init__(self, channel_id: int, connection: AMQPConnection, stream_buffer_size: int):
         """
         :param channel_id: The ID of this channel.
@@ -119,6 +156,25 @@ class Channel(ChannelLike):
         # used to count acks
         self._message_counter = 0
 
+        # set from a Return until the end of its content, which is dropped. the body size isn't
+        # known until the header arrives.
+        self._skipping_returned = False
+        self._returned_body_left: int | None = None
+
+        # encoded Basic.Publish frames, keyed by (exchange, routing key, mandatory, immediate). the
+        # channel ID never changes, so the entire frame can be cached.
+        self._publish_frames: dict[tuple[str, str, bool, bool], bytes] = {}
+
+        # set whilst a batch publish is waiting on its confirmations. these can arrive faster than
+        # a receiver would be waiting on the unbuffered regular stream, so they're buffered here.
+        self._confirm_sink: MemoryObjectSendStream[MethodPayload] | None = None
+
+        # the confirm sink for single publishes, made once as they're the hot path. a Return is
+        # followed by the message's own Ack, so this holds both.
+        self._publish_confirm_sink, self._publish_confirms = anyio.create_memory_object_stream[
+            MethodPayload
+        ](2)
+
     @override
     def __str__(self) -> str:
         return f"<Channel id={self.id} buffered={self.current_buffer_size}>"
@@ -176,6 +232,10 @@ class Channel(ChannelLike):
 
         self._send.close()
         self._delivery_send.close()
+        self._publish_confirm_sink.close()
+        if self._confirm_sink is not None:
+            self._confirm_sink.close()
+
         self._closed = True
 
         self._close_event.set()
@@ -185,14 +245,47 @@ class Channel(ChannelLike):
         Enqueues a regular method frame.
         """
 
-        self._send.send_nowait(frame)
+        if isinstance(frame.payload, BasicReturnPayload):
+            # its header and body follow, but nothing wants a returned message's content
+            self._skipping_returned = True
+            self._returned_body_left = None
+
+        if self._confirm_sink is not None and isinstance(frame.payload, _CONFIRM_PAYLOADS):
+            self._confirm_sink.send_nowait(frame.payload)
+        else:
+            self._send.send_nowait(frame)
+
+    def _skip_returned_content(self, frame: Frame) -> bool:
+        """
+        Checks if a header or body frame belongs to a returned message, and should be dropped
+        instead of delivered. Otherwise, these would fill up the delivery buffer with content that
+        nobody reads.
+        """
+
+        if not self._skipping_returned:
+            return False
+
+        if isinstance(frame, ContentHeaderFrame):
+            self._returned_body_left = frame.payload.full_size
+        elif isinstance(frame, BodyFrame) and self._returned_body_left is not None:
+            self._returned_body_left -= len(frame.data)
+
+        if self._returned_body_left is not None and self._returned_body_left <= 0:
+            self._skipping_returned = False
+
+        return True
 
     async def _enqueue_delivery(self, frame: Frame) -> None:
         """
         Enqueues a delivery frame.
         """
 
-        await self._delivery_send.send(frame)
+        # skip the checkpoint in ``send`` if there's already room in the buffer. the connection
+        # reader still checkpoints once per frame, so this can't starve anything.
+        try:
+            self._delivery_send.send_nowait(frame)
+        except WouldBlock:
+            await self._delivery_send.send(frame)
 
     async def _receive_delivery_message(self) -> AMQPMessage | None:
         """
@@ -278,8 +371,6 @@ class Channel(ChannelLike):
 
             raise UnexpectedCloseError.of(self._close_info) from None
 
-        # notify connection code that we received an event so it can unblock the channel
-        # noinspection PyAsyncCall
         return frame
 
     async def _wait_until_open(self) -> None:
@@ -335,6 +426,61 @@ class Channel(ChannelLike):
         # safe cast, we checked the type above.
         return cast(MethodFrame[PayloadType], returned)
 
+    async def _receive_confirms(
+        self, confirms: MemoryObjectReceiveStream[MethodPayload], first_tag: int, last_tag: int
+    ) -> MethodPayload | None:
+        """
+        Receives payloads from the confirm sink until every published message in a range of
+        delivery tags has been confirmed by the server.
+
+        :return: The first ``Return`` or ``Nack`` payload received, or None if every message was
+                 acknowledged.
+        """
+
+        failure: MethodPayload | None = None
+        # everything up to here has been confirmed. servers confirm mostly in order, so only tags
+        # confirmed ahead of this need remembering individually.
+        confirmed_through = first_tag - 1
+        ahead: set[int] = set()
+
+        while confirmed_through < last_tag:
+            try:
+                payload = await confirms.receive()
+            except EndOfStream:
+                if self._close_info is None:
+                    raise AMQPStateError("Channel was closed improperly") from None
+
+                raise UnexpectedCloseError.of(self._close_info) from None
+
+            if isinstance(payload, BasicReturnPayload):
+                # the Ack for the returned message still follows
+                failure = failure or payload
+                continue
+
+            assert isinstance(payload, BasicAckPayload | BasicNackPayload)
+            if isinstance(payload, BasicNackPayload):
+                failure = failure or payload
+
+            tag = payload.delivery_tag
+            if not confirmed_through < tag <= last_tag or tag in ahead:
+                raise AMQPStateError(
+                    f"Expected confirmation for delivery tags {first_tag} to {last_tag}, "
+                    f"but got confirmation for delivery tag {tag}"
+                )
+
+            if payload.multiple:
+                confirmed_through = tag
+                if ahead:
+                    ahead = {it for it in ahead if it > tag}
+            else:
+                ahead.add(tag)
+
+            while confirmed_through + 1 in ahead:
+                confirmed_through += 1
+                ahead.remove(confirmed_through)
+
+        return failure
+
     async def _send_and_receive_frame(
         self, payload: MethodPayload, expected_type: type[PayloadType] | None
     ) -> MethodFrame[PayloadType]:
@@ -398,7 +544,7 @@ class Channel(ChannelLike):
             auto_delete=auto_delete,
             internal=internal,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         await self._send_and_receive_frame(payload, ExchangeDeclareOkPayload)
@@ -457,7 +603,7 @@ class Channel(ChannelLike):
             source_name=source,
             routing_key=routing_key,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         await self._send_and_receive_frame(payload, ExchangeBindOkPayload)
@@ -490,7 +636,7 @@ class Channel(ChannelLike):
             source_name=source,
             routing_key=routing_key,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         await self._send_and_receive_frame(payload, ExchangeUnBindOkPayload)
@@ -525,7 +671,9 @@ class Channel(ChannelLike):
         :return: The :class:`.QueueDeclareOkPayload` the server returned.
         """
 
-        self._check_closed()
+        # inlined _check_closed
+        if self._closed:
+            raise ClosedResourceError("This channel is closed")
 
         payload = QueueDeclarePayload(
             reserved_1=0,
@@ -535,7 +683,7 @@ class Channel(ChannelLike):
             exclusive=exclusive,
             auto_delete=auto_delete,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         result = await self._send_and_receive_frame(payload, QueueDeclareOkPayload)
@@ -565,7 +713,7 @@ class Channel(ChannelLike):
             exchange_name=exchange_name,
             routing_key=routing_key,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         await self._send_and_receive_frame(payload, QueueBindOkPayload)
@@ -642,7 +790,7 @@ class Channel(ChannelLike):
             exchange_name=exchange_name,
             routing_key=routing_key,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         await self._send_and_receive_frame(payload, QueueUnbindOkPayload)
@@ -703,7 +851,7 @@ class Channel(ChannelLike):
             no_ack=no_ack,
             exclusive=exclusive,
             no_wait=False,
-            arguments=arguments or {},
+            arguments=arguments or _NO_ARGUMENTS,
         )
 
         response = await self._send_and_receive_frame(payload, BasicConsumeOkPayload)
@@ -758,9 +906,151 @@ class Channel(ChannelLike):
 
         # we have to send three manual frames before we get an ACK
 
-        self._check_closed()
+        # inlined _check_closed, this is the hot path
+        if self._closed:
+            raise ClosedResourceError("This channel is closed")
+
+        method_frame = self._publish_method_frame(exchange_name, routing_key, mandatory, immediate)
+        data = self._connection._encode_publish(
+            self._channel_id, [(method_frame, header or _DEFAULT_HEADER, body)]
+        )
 
+        # the lock only needs to cover sending the frames and waiting for the confirmation, as the
+        # confirmations are matched up to messages by the order they were sent in.
         async with self._lock:
+            delivery_tag = self._message_counter + 1
+            self._confirm_sink = self._publish_confirm_sink
+
+            sent = False
+            try:
+                await self._connection._send(data)
+                sent = True
+                # waits for the Ack after a Return too, so it can't be mistaken for the next
+                # message's
+                payload = await self._receive_confirms(
+                    self._publish_confirms, delivery_tag, delivery_tag
+                )
+            finally:
+                self._confirm_sink = None
+
+                if sent:
+                    self._message_counter = delivery_tag
+
+                # drop anything left behind by a cancelled wait
+                while True:
+                    try:
+                        self._publish_confirms.receive_nowait()
+                    except (WouldBlock, EndOfStream):
+                        break
+
+        if payload is None:
+            logger.trace(f"C#{self.id}: Server ACKed published message")
+
+        elif isinstance(payload, BasicReturnPayload):
+            raise MessageReturnedError(
+                exchange=payload.exchange,
+                routing_key=payload.routing_key,
+                reply_code=payload.reply_code,
+                reply_text=payload.reply_text,
+            )
+
+        elif isinstance(payload, BasicNackPayload):
+            raise AMQPStateError("Server NACKed message to be published")
+
+    @override
+    async def basic_publish_many(
+        self,
+        exchange_name: str,
+        messages: Iterable[tuple[str, bytes, BasicHeader | None]],
+        *,
+        mandatory: bool = True,
+        immediate: bool = False,
+    ) -> None:
+        """
+        Publishes several messages to a specific exchange. All of the messages are sent in a single
+        write, and then every confirmation is waited for at once.
+
+        :param exchange_name: The name of the exchange to publish to. This can be blank to mean the
+                              default exchange.
+        :param messages: An iterable of ``(routing_key, body, header)`` tuples, one per message.
+                         The header can be None to use the default blank headers.
+        :param mandatory: Iff True, the server must return a ``Return`` message if a message
+                          could not be routed to a queue.
+        :param immediate: Iff True, the server must return a ``Return`` message if a message could
+                          not be immediately consumed.
+        :raise MessageReturnedError: If any message was returned to the publisher. This is only
+                                     raised once every message has been confirmed.
+
+        .. warning::
+
+            The immediate flag is *not* supported in RabbitMQ 3.x, and will cause the connection
+            to close.
+        """
+
+        if self._closed:
+            raise ClosedResourceError("This channel is closed")
+
+        encoded = [
+            (
+                self._publish_method_frame(exchange_name, routing_key, mandatory, immediate),
+                header or _DEFAULT_HEADER,
+                body,
+            )
+            for routing_key, body, header in messages
+        ]
+
+        if not encoded:
+            await checkpoint()
+            return
+
+        # every message goes into a single buffer, so they're sent with one write
+        data = self._connection._encode_publish(self._channel_id, encoded)
+
+        async with self._lock:
+            first_tag = self._message_counter + 1
+            last_tag = self._message_counter + len(encoded)
+
+            # every message gets an Ack or Nack, and may get a Return before it
+            sink, confirms = anyio.create_memory_object_stream[MethodPayload](2 * len(encoded))
+            self._confirm_sink = sink
+
+            sent = False
+            try:
+                await self._connection._send(data)
+                sent = True
+                failure = await self._receive_confirms(confirms, first_tag, last_tag)
+            finally:
+                self._confirm_sink = None
+                sink.close()
+                confirms.close()
+
+                # the server numbers the messages whether or not we wait for their confirms
+                if sent:
+                    self._message_counter = last_tag
+
+        if isinstance(failure, BasicReturnPayload):
+            raise MessageReturnedError(
+                exchange=failure.exchange,
+                routing_key=failure.routing_key,
+                reply_code=failure.reply_code,
+                reply_text=failure.reply_text,
+            )
+
+        if isinstance(failure, BasicNackPayload):
+            raise AMQPStateError("Server NACKed message to be published")
+
+        logger.trace(f"C#{self.id}: Server ACKed {len(encoded)} published messages")
+
+    def _publish_method_frame(
+        self, exchange_name: str, routing_key: str, mandatory: bool, immediate: bool
+    ) -> bytes:
+        """
+        Gets the encoded ``Basic.Publish`` method frame for a message, from the cache if possible.
+        """
+
+        key = (exchange_name, routing_key, mandatory, immediate)
+        method_frame = self._publish_frames.get(key)
+        if method_frame is None:
             method_payload = BasicPublishPayload(
                 reserved_1=1,
                 name=exchange_name,
@@ -768,61 +1058,15 @@ class Channel(ChannelLike):
                 mandatory=mandatory,
                 immediate=immediate,
             )
+            method_frame = self._connection._encode_method_frame(self._channel_id, method_payload)
 
-            # 1) method frame
-            await self._connection._send_method_frame(self._channel_id, method_payload)
-
-            # 2) header frame
-            headers = header or BasicHeader()
-            response: MethodFrame[MethodPayload]
-            if body:
-                # Body is not empty, we send_and_receive with the body and not the headers.
-                await self._connection._send_header_frame(
-                    self._channel_id,
-                    method_klass=method_payload.klass,
-                    body_length=len(body),
-                    headers=headers,
-                )
-
-                # 3) Body
-                fn = partial(self._connection._send_body_frames, self._channel_id, body)
-                response = await self._send_and_receive(fn, None)
-
-            else:
-                # Body is empty, we send_and_receive with the headers.
-                fn = partial(
-                    self._connection._send_header_frame,
-                    self._channel_id,
-                    method_klass=method_payload.klass,
-                    body_length=len(body),
-                    headers=headers,
-                )
-
-                response = await self._send_and_receive(fn, None)
-
-            self._message_counter += 1
-
-            # 4) check for Ack or Return
-            payload = response.payload
+            if len(self._publish_frames) >= _PUBLISH_FRAME_CACHE_SIZE:
+                # evict the oldest entry, dicts are insertion ordered
+                del self._publish_frames[next(iter(self._publish_frames))]
 
-            if isinstance(payload, BasicAckPayload):
-                if payload.delivery_tag != self._message_counter:
-                    raise AMQPStateError(
-                        f"Expected Ack for delivery tag {self._message_counter}, "
-                        f"but got Ack for delivery tag {payload.delivery_tag}"
-                    )
-                logger.trace(f"C#{self.id}: Server ACKed published message")
-
-            elif isinstance(payload, BasicReturnPayload):
-                raise MessageReturnedError(
-                    exchange=payload.exchange,
-                    routing_key=payload.routing_key,
-                    reply_code=payload.reply_code,
-                    reply_text=payload.reply_text,
-                )
+            self._publish_frames[key] = method_frame
 
-            elif isinstance(payload, BasicNackPayload):
-                raise AMQPStateError("Server NACKed message to be published")
+        return method_frame
 
     # note to self: these are only defined on Channel cos they make no sense to be defined on
     # pools. oops!
@@ -6,13 +6,13 @@ import importlib.metadata
 import os
 import sys
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from functools import partial
 from os import PathLike
 from ssl import SSLContext
-from typing import Any
+from typing import Any, cast
 
 import anyio
 import attr
@@ -21,7 +21,7 @@ from anyio.abc import ByteStream, TaskGroup
 from anyio.lowlevel import checkpoint
 
 from serena.channel import Channel
-from serena.enums import ClassID, ReplyCode
+from serena.enums import ReplyCode
 from serena.exc import (
     AMQPError,
     AMQPStateError,
@@ -225,46 +225,40 @@ class AMQPConnection:
     # bleh, this is just a hotfix for data contention. i could probably fix this by driving the
     # writer with a background task writer, but that seems like it would achieve the exact same
     # thing...?
-    async def _send(self, data: bytes) -> None:
+    async def _send(self, data: bytes | bytearray) -> None:
         async with self._write_lock:
-            await self._sock.send(data)
+            # every backend's stream takes any bytes-like object, despite the annotation
+            await self._sock.send(cast(bytes, data))
 
     async def _send_method_frame(self, channel: int, payload: MethodPayload) -> None:
         """
         Sends a single method frame.
         """
 
-        data = self._parser.write_method_frame(channel, payload)
+        data = self._encode_method_frame(channel, payload)
         await self._send(data)
 
-    async def _send_header_frame(
-        self,
-        channel: int,
-        *,
-        method_klass: ClassID,
-        body_length: int,
-        headers: BasicHeader,
-    ) -> None:
+    def _encode_method_frame(self, channel: int, payload: MethodPayload) -> bytes:
         """
-        Sends a single header frame.
+        Encodes a single method frame without sending it.
         """
 
-        data = self._parser.write_header_frame(channel, method_klass, body_length, headers)
-        await self._send(data)
+        return self._parser.write_method_frame(channel, payload)
 
-    async def _send_body_frames(self, channel: int, body: bytes) -> None:
+    def _encode_publish(
+        self,
+        channel: int,
+        messages: Sequence[tuple[bytes, BasicHeader, bytes]],
+    ) -> bytearray:
         """
-        Sends multiple body frames.
+        Encodes the method, header, and body frames for one or more messages into one buffer, so
+        that they can be sent with a single write and can't be interleaved with frames from other
+        channels.
         """
 
-        data = self._parser.write_body_frames(channel, body, max_frame_size=self._max_frame_size)
-
-        if not data:
-            await checkpoint()
-            return
-
-        for frame in data:
-            await self._send(frame)
+        return self._parser.write_publish_frames(
+            channel, messages, max_frame_size=self._max_frame_size
+        )
 
     async def _close_ungracefully(self) -> None:
         """
@@ -623,6 +617,9 @@ class AMQPConnection:
                 channel = frame.channel_id
                 assert channel != 0, "header frame cannot happen on control channel"
                 channel_object = self._channel_channels[channel]
+                if channel_object._skip_returned_content(frame):
+                    continue
+
                 await self._enqueue_frame(channel_object, frame)
 
     async def _listen_wrapper(self) -> None:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import struct
+from collections.abc import Sequence
 from math import ceil
+from typing import Final
 
 from serena.frame import BodyFrame, Frame, HeartbeatFrame
 from serena.payloads.header import (
@@ -41,6 +43,11 @@ HEADER_FRAME = 2
 BODY_FRAME = 3
 HEARTBEAT_FRAME = 8
 
+# type, channel, size
+_FRAME_HEADER: Final = struct.Struct(">BHI")
+#: The number of bytes a frame takes up on top of its payload (the header and the frame-end octet).
+FRAME_OVERHEAD: Final = _FRAME_HEADER.size + 1
+
 
 class FrameParser:
     """
@@ -108,6 +115,24 @@ class FrameParser:
         header = struct.pack(">BHI", type_, channel, size)
         return header + payload + b"\xce"
 
+    @staticmethod
+    def _pack_frame_into(
+        buf: bytearray, offset: int, type_: int, channel: int, payload: bytes | memoryview
+    ) -> int:
+        """
+        Packs a single frame into ``buf`` at ``offset``.
+
+        :return: The offset directly after the written frame.
+        """
+
+        size = len(payload)
+        _FRAME_HEADER.pack_into(buf, offset, type_, channel, size)
+        offset += 7
+        buf[offset : offset + size] = payload
+        offset += size
+        buf[offset] = 0xCE
+        return offset + 1
+
     @staticmethod
     def write_method_frame(channel: int, payload: MethodPayload) -> bytes:
         """
@@ -162,6 +187,54 @@ class FrameParser:
 
         return frames
 
+    @staticmethod
+    def write_publish_frames(
+        channel: int,
+        messages: Sequence[tuple[bytes, BasicHeader, bytes]],
+        max_frame_size: int,
+    ) -> bytearray:
+        """
+        Writes the method, header, and body frames for one or more published messages into one
+        preallocated buffer.
+
+        :param channel: The channel ID these messages are being sent on.
+        :param messages: A sequence of ``(method_frame, headers, body)`` tuples, one per message.
+                         The method frame is the already encoded ``Basic.Publish`` method frame,
+                         as returned by :meth:`.write_method_frame`.
+        :param max_frame_size: The maximum size of a single body frame.
+        :return: The buffer to send over the wire.
+        """
+
+        header_bodies = [
+            serialise_basic_header(ClassID.BASIC, len(body), headers)
+            for _, headers, body in messages
+        ]
+
+        size = 0
+        for (method_frame, _, body), header_body in zip(messages, header_bodies, strict=True):
+            frames_needed = ceil(len(body) / max_frame_size)
+            size += len(method_frame) + len(header_body) + len(body)
+            size += (frames_needed + 1) * FRAME_OVERHEAD
+
+        buf = bytearray(size)
+        offset = 0
+
+        for (method_frame, _, body), header_body in zip(messages, header_bodies, strict=True):
+            method_end = offset + len(method_frame)
+            buf[offset:method_end] = method_frame
+            offset = FrameParser._pack_frame_into(
+                buf, method_end, HEADER_FRAME, channel, header_body
+            )
+
+            # sliced as a view so that bodies split over several frames are only copied once
+            view = memoryview(body)
+            for start in range(0, len(body), max_frame_size):
+                frame_body = view[start : start + max_frame_size]
+                offset = FrameParser._pack_frame_into(buf, offset, BODY_FRAME, channel, frame_body)
+
+        logger.trace(f"C#{channel}->S FRAME (PUBLISH): {len(messages)} messages in {size} bytes")
+        return buf
+
     def receive_data(self, data: bytes) -> None:
         """
         Receives incoming data from the AMQP server.
@@ -191,15 +264,14 @@ class FrameParser:
                 )
                 return NEED_DATA
 
-            # truncate frame-end octet
-            assert body[-1] == 0xCE, "invalid frame-end octet"
-            body = body[:-1]
+            # truncate frame-end octet. this has to come off the saved buffer, not just the last
+            # chunk, or body frames gain an extra byte.
+            packet = self._last_packet_buffer
+            assert packet[-1] == 0xCE, "invalid frame-end octet"
 
             # packet finished, construct frame from saved values
             self._processing_partial_packet = False
-            frame = self._make_frame(
-                self._saved_type, self._saved_channel, bytes(self._last_packet_buffer)
-            )
+            frame = self._make_frame(self._saved_type, self._saved_channel, bytes(packet[:-1]))
             self._last_packet_buffer = bytearray()
 
             return frame
@@ -210,14 +282,8 @@ class FrameParser:
                 return NEED_DATA
 
             # pop off bits
-            type_ = self._buffer[0]
-            channel = (self._buffer[1] << 8) | self._buffer[2]
-            size = (
-                self._buffer[3] << 24
-                | self._buffer[4] << 16
-                | self._buffer[5] << 8
-                | self._buffer[6]
-            ) + 1  # + 1 is for the frame end byte (0xCE)
+            type_, channel, size = _FRAME_HEADER.unpack_from(self._buffer)
+            size += 1  # + 1 is for the frame end byte (0xCE)
 
             logger.trace(f"Received packet ({type_=} | {channel=} | {size=})")
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import abc
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
 from contextlib import AbstractAsyncContextManager
 from typing import TYPE_CHECKING, Any
 
@@ -16,12 +15,14 @@ if TYPE_CHECKING:
     from serena.channel import Channel
 
 
-class ChannelLike(abc.ABC):
+class ChannelLike:
     """
     Base object shared between the :class:`.Channel` and :class:`.ChannelPool` object.
     """
 
-    @abc.abstractmethod
+    # empty so that subclasses can use slots
+    __slots__ = ()
+
     async def exchange_declare(
         self,
         name: str,
@@ -49,7 +50,8 @@ class ChannelLike(abc.ABC):
         :return: The name of the exchange, as it exists on the server.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def exchange_delete(
         self,
         name: str,
@@ -65,7 +67,8 @@ class ChannelLike(abc.ABC):
         :return: Nothing.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def exchange_bind(
         self,
         destination: str,
@@ -87,7 +90,8 @@ class ChannelLike(abc.ABC):
         :return: Nothing.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def exchange_unbind(
         self,
         destination: str,
@@ -109,7 +113,8 @@ class ChannelLike(abc.ABC):
         :return: Nothing.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def queue_declare(
         self,
         name: str,
@@ -139,7 +144,8 @@ class ChannelLike(abc.ABC):
         :return: The :class:`.QueueDeclareOkPayload` the server returned.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def queue_bind(
         self,
         queue_name: str,
@@ -157,7 +163,8 @@ class ChannelLike(abc.ABC):
         :return: Nothing.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def queue_delete(
         self,
         queue_name: str,
@@ -174,7 +181,8 @@ class ChannelLike(abc.ABC):
         :return: The number of messages deleted.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def queue_purge(
         self,
         queue_name: str,
@@ -186,7 +194,8 @@ class ChannelLike(abc.ABC):
         :return: The number of messages deleted.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def queue_unbind(
         self,
         queue_name: str,
@@ -203,7 +212,8 @@ class ChannelLike(abc.ABC):
         :param arguments: Implementation-specific arguments to use.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     def basic_consume(
         self,
         queue_name: str,
@@ -235,7 +245,8 @@ class ChannelLike(abc.ABC):
                          Serena-exclusive feature, not a protocol feature.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
     async def basic_publish(
         self,
         exchange_name: str,
@@ -267,7 +278,39 @@ class ChannelLike(abc.ABC):
             to close.
         """
 
-    @abc.abstractmethod
+        raise NotImplementedError
+
+    async def basic_publish_many(
+        self,
+        exchange_name: str,
+        messages: Iterable[tuple[str, bytes, BasicHeader | None]],
+        *,
+        mandatory: bool = True,
+        immediate: bool = False,
+    ) -> None:
+        """
+        Publishes several messages to a specific exchange. All of the messages are sent in a single
+        write, and then every confirmation is waited for at once.
+
+        :param exchange_name: The name of the exchange to publish to. This can be blank to mean the
+                              default exchange.
+        :param messages: An iterable of ``(routing_key, body, header)`` tuples, one per message.
+                         The header can be None to use the default blank headers.
+        :param mandatory: Iff True, the server must return a ``Return`` message if a message
+                          could not be routed to a queue.
+        :param immediate: Iff True, the server must return a ``Return`` message if a message could
+                          not be immediately consumed.
+        :raise MessageReturnedError: If any message was returned to the publisher. This is only
+                                     raised once every message has been confirmed.
+
+        .. warning::
+
+            The immediate flag is *not* supported in RabbitMQ 3.x, and will cause the connection
+            to close.
+        """
+
+        raise NotImplementedError
+
     async def basic_get(self, queue: str, *, no_ack: bool = False) -> AMQPMessage | None:
         """
         Gets a single message from a queue.
@@ -278,6 +321,27 @@ class ChannelLike(abc.ABC):
         :return: A :class:`.AMQPMessage` if one existed on the queue, otherwise None.
         """
 
+        raise NotImplementedError
+
+
+_DELEGATED_METHODS = (
+    "exchange_declare",
+    "exchange_delete",
+    "exchange_bind",
+    "exchange_unbind",
+    "queue_declare",
+    "queue_bind",
+    "queue_delete",
+    "queue_purge",
+    "queue_unbind",
+    "basic_consume",
+    "basic_publish",
+    "basic_publish_many",
+    "basic_get",
+)
+
+_DEFINITELY_DELEGATED_METHODS = ("basic_ack", "basic_reject", "basic_nack")
+
 
 class ChannelDelegate(ChannelLike):  # pragma: no cover
     """
@@ -291,6 +355,19 @@ class ChannelDelegate(ChannelLike):  # pragma: no cover
         """
 
         self._delegate: ChannelLike = channel
+        self._bind_delegated_methods(ChannelDelegate, _DELEGATED_METHODS)
+
+    def _bind_delegated_methods(self, owner: type[ChannelDelegate], names: tuple[str, ...]) -> None:
+        """
+        Binds the delegate's own methods directly onto this object, skipping the extra call and
+        coroutine of the forwarding methods below. Methods that a subclass has overridden are left
+        alone.
+        """
+
+        klass = type(self)
+        for name in names:
+            if getattr(klass, name) is getattr(owner, name):
+                setattr(self, name, getattr(self._delegate, name))
 
     @override
     async def exchange_declare(
@@ -446,6 +523,22 @@ class ChannelDelegate(ChannelLike):  # pragma: no cover
             immediate=immediate,
         )
 
+    @override
+    async def basic_publish_many(
+        self,
+        exchange_name: str,
+        messages: Iterable[tuple[str, bytes, BasicHeader | None]],
+        *,
+        mandatory: bool = True,
+        immediate: bool = False,
+    ) -> None:
+        return await self._delegate.basic_publish_many(
+            exchange_name=exchange_name,
+            messages=messages,
+            mandatory=mandatory,
+            immediate=immediate,
+        )
+
     @override
     async def basic_get(self, queue: str, *, no_ack: bool = False) -> AMQPMessage | None:
         return await self._delegate.basic_get(queue=queue, no_ack=no_ack)
@@ -460,6 +553,7 @@ class DefinitelyChannelDelegate(ChannelDelegate):
         self._delegate: Channel  # type: ignore
 
         super().__init__(channel)
+        self._bind_delegated_methods(DefinitelyChannelDelegate, _DEFINITELY_DELEGATED_METHODS)
 
     async def basic_ack(self, delivery_tag: int, *, multiple: bool = False) -> None:
         """
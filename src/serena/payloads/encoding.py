@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from types import UnionType
-from typing import Any, Union, get_args, get_origin
+import struct
+from collections.abc import Callable, Mapping
+from functools import cache
+from types import MemberDescriptorType, UnionType
+from typing import Any, Final, TypeAlias, Union, cast, get_args, get_origin
 
-from attr import Attribute
+import attr
+from attr import Attribute, AttrsInstance
 
 from serena.utils.buffer import DecodingBuffer, EncodingBuffer
 
@@ -12,44 +16,95 @@ def aq_type(name: str) -> dict[str, str]:
     return {"amqp_type": name}
 
 
-def encode_attrs_attribute(buf: EncodingBuffer, att: Attribute[Any], value: Any) -> None:
+def interned() -> dict[str, bool]:
+    """
+    Marks a short string field as usually repeating the same few values, such as exchange names or
+    consumer tags. Decoders reuse the same string objects for these, rather than decoding them
+    again every time.
     """
-    Encodes an attrs attribute on a class.
 
-    :param buf: The buffer to encode into.
-    :param att: The attribute to encode.
-    :param value: The value of the field.
-    :return:
+    return {"interned": True}
+
+
+@cache
+def resolved_fields(klass: type[AttrsInstance]) -> tuple[Attribute[Any], ...]:
+    """
+    Gets the attrs fields of a payload class, with their string annotations resolved. This is
+    cached per class as resolving types is expensive and the fields never change.
+    """
+
+    attr.resolve_types(klass)
+    return tuple(attr.fields(klass))
+
+
+# struct format characters for the fixed-width AMQP types, which can be packed together
+_FIXED_WIDTH_FORMATS: Final[dict[str, str]] = {
+    "octet": "B",
+    "octet_signed": "b",
+    "short": "H",
+    "short_signed": "h",
+    "long": "I",
+    "long_signed": "i",
+    "longlong": "Q",
+    "longlong_signed": "q",
+    "float": "f",
+    "double": "d",
+}
+
+
+def _field_kind(att: Attribute[Any]) -> str | None:
+    """
+    Gets the AMQP type of an attrs field, as used in the ``write_`` and ``read_`` method names of
+    the buffers.
+
+    :return: The type name, or None if this field isn't an AMQP field.
     """
 
     field_type = get_origin(att.type) or att.type
 
+    # we only allow Optional unions so this is always safe
     if field_type is Union or field_type is UnionType:
         unwrapped_field_type = get_args(att.type)[0]
         field_type = get_origin(unwrapped_field_type) or unwrapped_field_type
 
     if field_type is str:
-        buf.write_short_string(value)
+        return "short_string"
 
-    elif field_type is bytes:
-        buf.write_long_string(value)
+    if field_type is bytes:
+        return "long_string"
+
+    if field_type is bool:
+        return "bit"
 
-    elif field_type is bool:
-        buf.write_bit(value)
+    if field_type is dict or field_type is Mapping:
+        return "table"
 
-    elif field_type is dict:
-        buf.write_table(value)
+    if field_type is list:
+        return "array"
 
-    elif field_type is list:
+    # not an amqp field, probably default field?
+    return att.metadata.get("amqp_type") or None
+
+
+def encode_attrs_attribute(buf: EncodingBuffer, att: Attribute[Any], value: Any) -> None:
+    """
+    Encodes an attrs attribute on a class.
+
+    :param buf: The buffer to encode into.
+    :param att: The attribute to encode.
+    :param value: The value of the field.
+    :return:
+    """
+
+    kind = _field_kind(att)
+    if kind is None:
+        return
+
+    if kind == "array":
         # todo
         raise NotImplementedError("list types")
 
-    else:
-        type_ = att.metadata.get("amqp_type")
-        if not type_:  # not an amqp field, probably default field?
-            return
-
-        getattr(buf, f"write_{type_}")(value)
+    getattr(buf, f"write_{kind}")(value)
 
 
 def decode_attrs_attribute(buf: DecodingBuffer, att: Attribute[Any]) -> Any:
@@ -61,30 +116,239 @@ def decode_attrs_attribute(buf: DecodingBuffer, att: Attribute[Any]) -> Any:
     :return: The decoded value, or None if there was nothing to decode.
     """
 
-    field_type = get_origin(att.type) or att.type
+    kind = _field_kind(att)
+    if kind is None:
+        return None
 
-    # we only allow Optional unions so this is always safe
-    if field_type is Union or field_type is UnionType:
-        unwrapped_field_type = get_args(att.type)[0]
-        field_type = get_origin(unwrapped_field_type) or unwrapped_field_type
+    if kind == "bit":
+        # a bit's position in its octet depends on how many bits follow it, so they can only be
+        # read a whole run at a time
+        raise NotImplementedError("bit fields can only be decoded with build_decoder")
 
-    if field_type is str:
-        return buf.read_short_string()
+    return getattr(buf, f"read_{kind}")()
 
-    if field_type is bytes:
-        return buf.read_long_string()
 
-    if field_type is bool:
-        return buf.read_bit()
+#: One slot of a packed struct. This is either a single fixed-width field, or a run of up to eight
+#: bit fields that share an octet.
+_Slot: TypeAlias = "list[Attribute[Any]]"
 
-    if field_type is dict:
-        return buf.read_table()
 
-    if field_type is list:
-        return buf.read_array()
+def _is_bit_slot(slot: _Slot) -> bool:
+    return _field_kind(slot[0]) == "bit"
 
-    type_ = att.metadata.get("amqp_type")
-    if not type_:  # not an amqp field, probably default field?
-        return None
 
-    return getattr(buf, f"read_{type_}")()
+def _field_schedule(
+    fields: tuple[Attribute[Any], ...],
+) -> list[tuple[str | None, list[_Slot]]]:
+    """
+    Splits a class's fields, in order, into the segments that its encoder and decoder work on.
+
+    Consecutive fixed-width and bit fields are merged into a single ``"struct"`` segment, with one
+    slot per fixed-width field and per octet of bits. This means that the boundaries between bit
+    octets are known up front, rather than being tracked by the buffer whilst writing.
+
+    :return: A list of ``(kind, slots)`` pairs. Every field that isn't part of a struct segment is
+             in a segment of its own, with the field's AMQP type as the kind.
+    """
+
+    segments: list[tuple[str | None, list[_Slot]]] = []
+
+    for att in fields:
+        kind = _field_kind(att)
+        if kind not in _FIXED_WIDTH_FORMATS and kind != "bit":
+            segments.append((kind, [[att]]))
+            continue
+
+        if not segments or segments[-1][0] != "struct":
+            segments.append(("struct", []))
+
+        slots = segments[-1][1]
+        if kind == "bit" and slots and _is_bit_slot(slots[-1]) and len(slots[-1]) < 8:
+            slots[-1].append(att)
+        else:
+            slots.append([att])
+
+    return segments
+
+
+def _bit_shifts(slot: _Slot) -> list[tuple[Attribute[Any], int]]:
+    """
+    Gets the bit position of every field in a slot of bit fields, within their shared octet.
+
+    Payloads declare their bits in reverse protocol order, so the last declared field is the
+    lowest bit. This matches what :meth:`.EncodingBuffer.write_bit` does.
+    """
+
+    count = len(slot)
+    return [(att, count - 1 - idx) for idx, att in enumerate(slot)]
+
+
+def _slot_format(slot: _Slot) -> str:
+    if _is_bit_slot(slot):
+        return "B"
+
+    return _FIXED_WIDTH_FORMATS[_field_kind(slot[0]) or ""]
+
+
+def _struct_for(slots: list[_Slot]) -> struct.Struct:
+    return struct.Struct("!" + "".join(_slot_format(slot) for slot in slots))
+
+
+def _slot_value(slot: _Slot) -> str:
+    """
+    Gets the expression an encoder writes for a slot. Bits are shifted into place and combined
+    into their octet.
+    """
+
+    if not _is_bit_slot(slot):
+        return f"payload.{slot[0].name}"
+
+    shifted = (
+        f"(payload.{att.name} << {shift})" if shift else f"payload.{att.name}"
+        for att, shift in _bit_shifts(slot)
+    )
+    return " | ".join(shifted)
+
+
+def _compile(
+    klass: type[AttrsInstance], name: str, lines: list[str], namespace: dict[str, Any]
+) -> Any:
+    source = "\n".join(lines)
+    code = compile(source, f"<serena {name} for {klass.__qualname__}>", "exec")
+    exec(code, namespace)
+    return namespace[name]
+
+
+@cache
+def build_encoder(klass: type[AttrsInstance]) -> Callable[[Any, EncodingBuffer], None]:
+    """
+    Generates a function that encodes every field of an attrs class into a buffer, in order.
+
+    This does the same thing as calling :func:`.encode_attrs_attribute` on every field, but the
+    per-field type dispatch is done once, when the function is generated. Runs of fixed-width and
+    bit fields are packed with a single :class:`struct.Struct`, with bits combined into their
+    octets beforehand, so the buffer never has pending bits to flush.
+    """
+
+    lines = ["def encode(payload, buf):"]
+    namespace: dict[str, Any] = {}
+
+    for idx, (kind, slots) in enumerate(_field_schedule(resolved_fields(klass))):
+        if kind is None:
+            continue
+
+        if kind == "array":
+            # todo
+            raise NotImplementedError("list types")
+
+        if kind != "struct":
+            lines.append(f"    buf.write_{kind}(payload.{slots[0][0].name})")
+
+        # a lone field is cheaper to write with its own method
+        elif len(slots) == 1 and _is_bit_slot(slots[0]):
+            lines.append(f"    buf.write_octet({_slot_value(slots[0])})")
+        elif len(slots) == 1:
+            lines.append(f"    buf.write_{_field_kind(slots[0][0])}(payload.{slots[0][0].name})")
+
+        else:
+            namespace[f"struct_{idx}"] = _struct_for(slots)
+            values = ", ".join(_slot_value(slot) for slot in slots)
+            lines.append(f"    buf.write_struct(struct_{idx}, {values})")
+
+    lines.append("    return None")
+    encoder: Callable[[Any, EncodingBuffer], None] = _compile(klass, "encode", lines, namespace)
+    return encoder
+
+
+@cache
+def build_decoder(klass: type[AttrsInstance]) -> Callable[[DecodingBuffer], Any]:
+    """
+    Generates a function that decodes every field of an attrs class from a buffer, in order, and
+    returns a new instance of the class.
+
+    This does the same thing as calling :func:`.decode_attrs_attribute` on every field, but the
+    per-field type dispatch is done once, when the function is generated. Runs of fixed-width and
+    bit fields are unpacked with a single :class:`struct.Struct`, and bits are then masked out of
+    their octets.
+    """
+
+    lines = ["def decode(buf):"]
+    namespace: dict[str, Any] = {"klass": klass}
+    arguments: list[str] = []
+
+    for idx, (kind, slots) in enumerate(_field_schedule(resolved_fields(klass))):
+        arguments.extend(f"{att.name}=f_{att.name}" for slot in slots for att in slot)
+
+        if kind == "struct":
+            namespace[f"struct_{idx}"] = _struct_for(slots)
+            targets = "".join(
+                f"bits_{idx}_{num}, " if _is_bit_slot(slot) else f"f_{slot[0].name}, "
+                for num, slot in enumerate(slots)
+            )
+            lines.append(f"    ({targets}) = buf.read_struct(struct_{idx})")
+
+            for num, slot in enumerate(slots):
+                if _is_bit_slot(slot):
+                    lines.extend(
+                        f"    f_{att.name} = (bits_{idx}_{num} & {1 << shift}) != 0"
+                        for att, shift in _bit_shifts(slot)
+                    )
+        else:
+            if kind == "short_string" and slots[0][0].metadata.get("interned"):
+                kind = "interned_short_string"
+
+            value = "None" if kind is None else f"buf.read_{kind}()"
+            lines.append(f"    f_{slots[0][0].name} = {value}")
+
+    if _can_construct_directly(klass):
+        lines.extend(_direct_construction(klass, namespace))
+    else:
+        lines.append(f"    return klass({', '.join(arguments)})")
+
+    decoder: Callable[[DecodingBuffer], Any] = _compile(klass, "decode", lines, namespace)
+    return decoder
+
+
+def _can_construct_directly(klass: type[AttrsInstance]) -> bool:
+    """
+    Checks if a class can be built by writing to its slots directly, which skips the frozen
+    ``__setattr__`` dance in the attrs ``__init__``. This is only safe if the ``__init__`` would
+    do nothing else.
+    """
+
+    if hasattr(klass, "__attrs_pre_init__") or hasattr(klass, "__attrs_post_init__"):
+        return False
+
+    for att in resolved_fields(klass):
+        if att.validator is not None or not att.init:
+            return False
+
+        if not isinstance(getattr(klass, att.name, None), MemberDescriptorType):
+            return False
+
+    return True
+
+
+def _direct_construction(klass: type[AttrsInstance], namespace: dict[str, Any]) -> list[str]:
+    """
+    Generates the lines that build an instance of ``klass`` from the ``f_`` locals of a decoder,
+    applying any field converters on the way.
+    """
+
+    namespace["new"] = object.__new__
+    lines = ["    obj = new(klass)"]
+
+    for att in resolved_fields(klass):
+        value = f"f_{att.name}"
+        # attrs doesn't say what a field's converter takes, which strict pyright rejects
+        converter = cast(Any, att.converter)  # pyright: ignore[reportUnknownMemberType]
+        if converter is not None:
+            namespace[f"convert_{att.name}"] = converter
+            value = f"convert_{att.name}({value})"
+
+        # slot descriptors write straight to the instance, ignoring the frozen check
+        namespace[f"set_{att.name}"] = getattr(klass, att.name).__set__
+        lines.append(f"    set_{att.name}(obj, {value})")
+
+    lines.append("    return obj")
+    return lines
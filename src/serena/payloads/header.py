@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import struct
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Final
 
 import attr
 
@@ -11,6 +11,7 @@ from serena.payloads.encoding import (
     aq_type,
     decode_attrs_attribute,
     encode_attrs_attribute,
+    resolved_fields,
 )
 from serena.payloads.method import ClassID
 from serena.utils.buffer import DecodingBuffer, EncodingBuffer
@@ -20,6 +21,9 @@ from serena.utils.buffer import DecodingBuffer, EncodingBuffer
 # additionally, bit properties are packed differently but as there's no actual bit properties
 # i skip the implementation.
 
+# class id, weight (always zero), body size, property flags
+_HEADER: Final = struct.Struct(">HHQH")
+
 
 @attr.s(frozen=True, slots=True)
 class ContentHeaderFrame(Frame):
@@ -100,16 +104,11 @@ def deserialise_basic_header(payload: bytes) -> ContentHeaderPayload:
     Deserialises the Basic content header into a payload object.
     """
 
-    klass, body_size, flags, rest = (
-        ClassID(int.from_bytes(payload[0:2], byteorder="big")),
-        int.from_bytes(payload[4:12], byteorder="big"),
-        int.from_bytes(payload[12:14], byteorder="big"),
-        payload[14:],
-    )
+    klass_id, _, body_size, flags = _HEADER.unpack_from(payload)
+    klass = ClassID(klass_id)
 
-    attr.resolve_types(BasicHeader)  # type: ignore
-    fields: Sequence[attr.Attribute[Any | None]] = attr.fields(BasicHeader)  # type: ignore
-    buffer = DecodingBuffer(rest)
+    fields: Sequence[attr.Attribute[Any | None]] = resolved_fields(BasicHeader)
+    buffer = DecodingBuffer(payload, offset=_HEADER.size)
 
     params = {}
 
@@ -133,19 +132,19 @@ def serialise_basic_header(klass_id: ClassID, body_size: int, body: BasicHeader)
     :param body: The header body.
     """
 
-    # yikes, attrs type hints kinda suck here?
-    attr.resolve_types(BasicHeader)  # type: ignore
-    fields: Sequence[attr.Attribute[Any | None]] = attr.fields(BasicHeader)  # type: ignore
-    buffer = EncodingBuffer()
+    fields: Sequence[attr.Attribute[Any | None]] = resolved_fields(BasicHeader)
+    values = [getattr(body, field.name) for field in fields]
 
     flags = 0
-
-    for idx, field in enumerate(fields):
-        field_value = getattr(body, field.name)
+    for idx, field_value in enumerate(values):
         if field_value:  # truthy check for the empty dict
             bit_idx = len(fields) - (idx - 1)
             flags |= 1 << bit_idx
+
+    # the flags have to be known before the property list can be written after them
+    buffer = EncodingBuffer(prefix=_HEADER.pack(klass_id.value, 0, body_size, flags))
+    for field, field_value in zip(fields, values, strict=True):
+        if field_value:
             encode_attrs_attribute(buffer, field, field_value)
 
-    header = struct.pack(">HHQH", klass_id.value, 0, body_size, flags)
-    return header + buffer.get_data()
+    return buffer.get_data()
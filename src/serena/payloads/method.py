@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, ClassVar, Generic, TypeVar
+import struct
+from collections.abc import Mapping
+from typing import Any, ClassVar, Final, Generic, TypeVar
 
 import attr
 
@@ -9,8 +11,9 @@ from serena.enums import ClassID, ReplyCode
 from serena.frame import Frame, FrameType
 from serena.payloads.encoding import (
     aq_type,
-    decode_attrs_attribute,
-    encode_attrs_attribute,
+    build_decoder,
+    build_encoder,
+    interned,
 )
 from serena.utils.buffer import DecodingBuffer, EncodingBuffer
 
@@ -20,6 +23,10 @@ from serena.utils.buffer import DecodingBuffer, EncodingBuffer
 # so NAMED FUNCTION IT IS!
 
 
+# class ID, method ID
+_HEADER: Final = struct.Struct(">HH")
+
+
 def _fuck_fuck_fuck(what: int) -> ReplyCode:
     return ReplyCode(what)
 
@@ -366,7 +373,7 @@ class ExchangeDeclarePayload(MethodPayload):
     passive: bool = attr.ib()
 
     #: Implementation-specific arguments for the declaration.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -442,7 +449,7 @@ class ExchangeBindPayload(MethodPayload):
     no_wait: bool = attr.ib()
 
     #: Implementation-specific arguments for the declaration.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -483,7 +490,7 @@ class ExchangeUnBindPayload(MethodPayload):
     no_wait: bool = attr.ib()
 
     #: Implementation-specific arguments for the declaration.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -531,7 +538,7 @@ class QueueDeclarePayload(MethodPayload):
     passive: bool = attr.ib()
 
     #: Implementation-specific arguments for the declaration.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -579,7 +586,7 @@ class QueueBindPayload(MethodPayload):
     no_wait: bool = attr.ib()
 
     #: A set of implementation-specific (or exchange-specific) arguments.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -693,7 +700,7 @@ class QueueUnbindPayload(MethodPayload):
     no_wait: bool = attr.ib()
 
     #: A set of implementation-specific (or exchange-specific) arguments.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -768,7 +775,7 @@ class BasicConsumePayload(MethodPayload):
     no_local: bool = attr.ib()
 
     #: Extra, implementation specific arguments.
-    arguments: dict[str, Any] = attr.ib()
+    arguments: Mapping[str, Any] = attr.ib()
 
 
 @attr.s(frozen=True, slots=True)
@@ -876,7 +883,7 @@ class BasicDeliverPayload(MethodPayload):
     is_client_side = True
 
     #: The identifier for the consumer.
-    consumer_tag: str = attr.ib()
+    consumer_tag: str = attr.ib(metadata=interned())
 
     #: The server-assigned delivery tag.
     delivery_tag: int = attr.ib(metadata=aq_type("longlong"))
@@ -885,10 +892,10 @@ class BasicDeliverPayload(MethodPayload):
     redelivered: bool = attr.ib()
 
     #: The name of the exchange the message was originally published to.
-    exchange_name: str = attr.ib()
+    exchange_name: str = attr.ib(metadata=interned())
 
     #: The routing key for the message.
-    routing_key: str = attr.ib()
+    routing_key: str = attr.ib(metadata=interned())
 
 
 @attr.s(frozen=True, slots=True)
@@ -927,10 +934,10 @@ class BasicGetOkPayload(MethodPayload):
     redelivered: bool = attr.ib()
 
     #: The name of the exchange the message was originally published to.
-    exchange_name: str = attr.ib()
+    exchange_name: str = attr.ib(metadata=interned())
 
     #: The routing key for the message.
-    routing_key: str = attr.ib()
+    routing_key: str = attr.ib(metadata=interned())
 
     #: The message count remaining for the queue.
     message_count: int = attr.ib(metadata=aq_type("long"))
@@ -1060,7 +1067,7 @@ PAYLOAD_TYPES: dict[ClassID, dict[int, type[MethodPayload]]] = {
         ExchangeBindPayload.method: ExchangeBindPayload,
         ExchangeBindOkPayload.method: ExchangeBindOkPayload,
         ExchangeUnBindPayload.method: ExchangeUnBindPayload,
-        ExchangeUnBindOkPayload.method: ExchangeUnBindPayload,
+        ExchangeUnBindOkPayload.method: ExchangeUnBindOkPayload,
     },
     ClassID.QUEUE: {
         QueueDeclarePayload.method: QueueDeclarePayload,
@@ -1084,10 +1091,12 @@ PAYLOAD_TYPES: dict[ClassID, dict[int, type[MethodPayload]]] = {
         BasicQOSPayload.method: BasicQOSPayload,
         BasicQOSOkPayload.method: BasicQOSOkPayload,
         BasicAckPayload.method: BasicAckPayload,
+        BasicRejectPayload.method: BasicRejectPayload,
         BasicGetPayload.method: BasicGetPayload,
         BasicGetOkPayload.method: BasicGetOkPayload,
         BasicGetEmptyPayload.method: BasicGetEmptyPayload,
         BasicReturnPayload.method: BasicReturnPayload,
+        BasicNackPayload.method: BasicNackPayload,
     },
     ClassID.CONFIRM: {
         ConfirmSelectPayload.method: ConfirmSelectPayload,
@@ -1095,6 +1104,29 @@ PAYLOAD_TYPES: dict[ClassID, dict[int, type[MethodPayload]]] = {
     },
 }
 
+# flattened version of the above, keyed by ``(class_id << 16) | method_id``. this is the same as the
+# first four bytes of a method payload read as a big-endian int.
+_PAYLOAD_BY_ID: Final[dict[int, type[MethodPayload]]] = {
+    (klass << 16) | method: payload_klass
+    for klass, methods in PAYLOAD_TYPES.items()
+    for method, payload_klass in methods.items()
+}
+
+# the class and method IDs never change for a payload type, so the header written before the fields
+# is packed once up front.
+_HEADER_BYTES: Final[dict[type[MethodPayload], bytes]] = {
+    payload_klass: _HEADER.pack(payload_klass.klass, payload_klass.method)
+    for payload_klass in _PAYLOAD_BY_ID.values()
+}
+
+# payloads without any fields are all identical, and immutable, so one instance of each is decoded
+# every time instead of building a new one.
+_EMPTY_PAYLOADS: Final[dict[int, MethodPayload]] = {
+    key: payload_klass()
+    for key, payload_klass in _PAYLOAD_BY_ID.items()
+    if not attr.fields(payload_klass)
+}
+
 
 def deserialise_payload(body: bytes) -> MethodPayload:
     """
@@ -1104,26 +1136,20 @@ def deserialise_payload(body: bytes) -> MethodPayload:
     :return: A :class:`.MethodPayload` matching the returned payload.
     """
 
-    klass, method, rest = (
-        ClassID(int.from_bytes(body[0:2], byteorder="big")),
-        int.from_bytes(body[2:4], byteorder="big"),
-        body[4:],
-    )
+    klass_id, method_id = _HEADER.unpack_from(body)
+    key = (klass_id << 16) | method_id
+
+    empty = _EMPTY_PAYLOADS.get(key)
+    if empty is not None:
+        return empty
 
     try:
-        payload_klass = PAYLOAD_TYPES[klass][method]
+        payload_klass = _PAYLOAD_BY_ID[key]
     except KeyError:
-        raise KeyError(f"Unknown method: {klass.name}/{method}") from None
-
-    attr.resolve_types(payload_klass)  # type: ignore
-    fields = attr.fields(payload_klass)
-    init_params = {}
-    buffer = DecodingBuffer(rest)
+        raise KeyError(f"Unknown method: {key >> 16}/{key & 0xFFFF}") from None
 
-    for field in fields:
-        init_params[field.name] = decode_attrs_attribute(buffer, field)
-
-    return payload_klass(**init_params)
+    payload: MethodPayload = build_decoder(payload_klass)(DecodingBuffer(body, offset=_HEADER.size))
+    return payload
 
 
 def serialise_payload(payload: MethodPayload) -> bytes:
@@ -1132,17 +1158,14 @@ def serialise_payload(payload: MethodPayload) -> bytes:
     """
 
     typ = type(payload)
-    attr.resolve_types(typ)  # type: ignore
-
-    header = typ.klass.to_bytes(2, byteorder="big") + typ.method.to_bytes(2, byteorder="big")
 
-    buf = EncodingBuffer()
-    fields = attr.fields(typ)
-    for field in fields:
-        encode_attrs_attribute(buf, field, getattr(payload, field.name))
+    header = _HEADER_BYTES.get(typ)
+    if header is None:
+        header = _HEADER.pack(typ.klass, typ.method)
 
-    buf.force_write_bits()
-    return header + buf.get_data()
+    buf = EncodingBuffer(prefix=header)
+    build_encoder(typ)(payload, buf)
+    return buf.get_data()
 
 
 def method_payload_name(payload: MethodPayload) -> str:
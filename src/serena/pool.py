@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, AsyncIterable
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
 from contextlib import asynccontextmanager
 from typing import (
     TYPE_CHECKING,
@@ -40,7 +40,10 @@ class ChannelPool(ChannelLike):
             max_buffer_size=initial_size
         )
 
-        self._needs_new_connection = Event()
+        # the number of channels that have been lost and need replacing. the event is only
+        # recreated by the opener when it actually has to wait, so wakeups can't be lost.
+        self._channels_needed = 0
+        self._needs_new_channel = Event()
 
     @property
     def idle_channels(self) -> int:
@@ -91,7 +94,12 @@ class ChannelPool(ChannelLike):
         """
 
         while True:
-            await self._needs_new_connection.wait()
+            if self._channels_needed <= 0:
+                self._needs_new_channel = Event()
+                await self._needs_new_channel.wait()
+                continue
+
+            self._channels_needed -= 1
             channel = await self._conn._open_channel()
             self._qwrite.send_nowait(channel)
 
@@ -108,9 +116,8 @@ class ChannelPool(ChannelLike):
         try:
             yield channel
         except UnexpectedCloseError:
-            # noinspection PyAsyncCall
-            self._needs_new_connection.set()
-            self._needs_new_connection = Event()
+            self._channels_needed += 1
+            self._needs_new_channel.set()
             raise
 
         # gross!
@@ -224,6 +231,44 @@ class ChannelPool(ChannelLike):
                 immediate=immediate,
             )
 
+    @override
+    async def basic_publish_many(
+        self,
+        exchange_name: str,
+        messages: Iterable[tuple[str, bytes, BasicHeader | None]],
+        *,
+        mandatory: bool = True,
+        immediate: bool = False,
+    ) -> None:
+        """
+        Publishes several messages to a specific exchange. All of the messages are sent in a single
+        write, and then every confirmation is waited for at once.
+
+        :param exchange_name: The name of the exchange to publish to. This can be blank to mean the
+                              default exchange.
+        :param messages: An iterable of ``(routing_key, body, header)`` tuples, one per message.
+                         The header can be None to use the default blank headers.
+        :param mandatory: Iff True, the server must return a ``Return`` message if a message
+                          could not be routed to a queue.
+        :param immediate: Iff True, the server must return a ``Return`` message if a message could
+                          not be immediately consumed.
+        :raise MessageReturnedError: If any message was returned to the publisher. This is only
+                                     raised once every message has been confirmed.
+
+        .. warning::
+
+            The immediate flag is *not* supported in RabbitMQ 3.x, and will cause the connection
+            to close.
+        """
+
+        async with self.checkout() as channel:
+            await channel.basic_publish_many(
+                exchange_name=exchange_name,
+                messages=messages,
+                mandatory=mandatory,
+                immediate=immediate,
+            )
+
     @override
     async def exchange_bind(
         self,
@@ -369,7 +414,7 @@ class ChannelPool(ChannelLike):
     @override
     async def queue_declare(
         self,
-        name: str,
+        name: str = "",
         *,
         passive: bool = False,
         durable: bool = False,
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import struct
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime
+from functools import cache
 from io import BytesIO
-from typing import Any, overload
+from typing import Any, cast, overload
+
+
+@cache
+def _network_struct(fmt: str) -> struct.Struct:
+    return struct.Struct("!" + fmt)
+
+
+#: The maximum number of distinct strings kept for interning short strings.
+_INTERNED_STRINGS_SIZE = 1024
+
+# decoded short strings, keyed by their encoded bytes. once full, new strings are just decoded as
+# normal, as the values that repeat (exchanges, routing keys, consumer tags) are seen early on.
+_INTERNED_STRINGS: dict[bytes, str] = {}
 
 
 class DecodingBuffer:
@@ -15,17 +29,17 @@ class DecodingBuffer:
     A buffer that allows automatic decoding of AMQP wire protocol objects.
     """
 
-    def __init__(self, payload_data: bytes) -> None:
+    def __init__(self, payload_data: bytes | memoryview, offset: int = 0) -> None:
         """
         :param payload_data: The payload itself to decode.
+        :param offset: The offset into ``payload_data`` to start decoding from, such as the end of
+                       a header that has already been read.
         """
 
-        self._data = payload_data
-        self._offset = 0
-
-        # copied when doing a read bit
-        self._last_bit_data = 0
-        self._last_bit_offset = 0
+        # strings and tables are read as views into the payload, so they're only copied once
+        # into their final object
+        self._data: memoryview = memoryview(payload_data)
+        self._offset: int = offset
 
     @property
     def has_data(self) -> bool:
@@ -36,26 +50,29 @@ class DecodingBuffer:
         return self._offset < len(self._data)
 
     def _unpack(self, fmt: str) -> tuple[Any, ...]:
-        fmt = "!" + fmt
-        size = struct.calcsize(fmt)
-        items = struct.unpack_from(fmt, self._data, self._offset)
-        self._offset += size
+        return self.read_struct(_network_struct(fmt))
+
+    def read_struct(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        """
+        Reads several fixed-width values from the stream in one go.
+
+        :param fmt: The precompiled, big-endian :class:`struct.Struct` to unpack with.
+        """
 
-        # wipe bit data
-        self._last_bit_data = 0
-        self._last_bit_offset = 0
+        items = fmt.unpack_from(self._data, self._offset)
+        self._offset += fmt.size
 
         return items
 
-    def _read_size(self, size: int) -> bytes:
+    def _read_view(self, size: int) -> memoryview:
         data = self._data[self._offset : self._offset + size]
         self._offset += size
 
-        self._last_bit_data = 0
-        self._last_bit_offset = 0
-
         return data
 
+    def _read_size(self, size: int) -> bytes:
+        return bytes(self._read_view(size))
+
     def read_octet_signed(self) -> int:
         """
         Reads a single signed octet from the stream.
@@ -118,7 +135,30 @@ class DecodingBuffer:
         """
 
         size = self.read_octet()
-        return self._read_size(size).decode(encoding="utf-8")
+        return str(self._read_view(size), encoding="utf-8")
+
+    def read_interned_short_string(self) -> str:
+        """
+        Reads a single short string from the stream, reusing the same string object for values
+        that have been read before.
+        """
+
+        size = self.read_octet()
+        view = self._read_view(size)
+
+        # only views over immutable data can be hashed
+        if not view.readonly:
+            return str(view, encoding="utf-8")
+
+        # memoryviews hash and compare the same as the bytes they're over, so the lookup doesn't
+        # need a copy
+        result = _INTERNED_STRINGS.get(view)  # type: ignore[call-overload]
+        if result is None:
+            result = str(view, encoding="utf-8")
+            if len(_INTERNED_STRINGS) < _INTERNED_STRINGS_SIZE:
+                _INTERNED_STRINGS[bytes(view)] = result
+
+        return result
 
     def read_long_string(self) -> bytes:
         """
@@ -188,8 +228,8 @@ class DecodingBuffer:
         Reads a table from the stream.
         """
 
-        table = self.read_long_string()
-        buf = DecodingBuffer(table)
+        size = self.read_long()
+        buf = DecodingBuffer(self._read_view(size))
 
         result: dict[str, Any] = {}
 
@@ -200,35 +240,24 @@ class DecodingBuffer:
 
         return result
 
-    def read_bit(self) -> bool:
-        """
-        Reads a single bit from the stream, as a boolean.
-        """
-
-        if 0 < self._last_bit_offset < 8:
-            bit = ((self._last_bit_data) & (1 << self._last_bit_offset)) == 1
-            self._last_bit_offset += 1
-            return bit
-
-        # copy next bit off
-        data = self._unpack("B")[0]
-        self._last_bit_data = data
-        bit = (data & 1) == 1
-        self._last_bit_offset += 1
-        return bit
-
 
 class EncodingBuffer:
     """
     A buffer that writes data in AMQP format.
     """
 
-    def __init__(self) -> None:
-        self._table_mode = False
-        self._data = BytesIO()
+    def __init__(self, prefix: bytes = b"") -> None:
+        """
+        :param prefix: Raw bytes to start the buffer with, such as a payload header. These are
+                       included in the output of :meth:`.get_data`.
+        """
+
+        self._table_mode: bool = False
+        self._data: BytesIO = BytesIO()
+        self._data.write(prefix)
 
-        self._last_bit_data = 0
-        self._last_bit_offset = 0
+        self._last_bit_data: int = 0
+        self._last_bit_offset: int = 0
 
     def _write(self, data: bytes) -> None:
         if self._last_bit_offset > 0:
@@ -238,18 +267,23 @@ class EncodingBuffer:
 
         self._data.write(data)
 
+    def write_struct(self, fmt: struct.Struct, *values: Any) -> None:
+        """
+        Writes several fixed-width values to the buffer in one go. Unlike the individual ``write_``
+        methods, this never writes table type prefixes.
+
+        :param fmt: The precompiled, big-endian :class:`struct.Struct` to pack with.
+        """
+
+        self._write(fmt.pack(*values))
+
     def get_data(self) -> bytes:
         """
         Gets the raw data in this buffer. This preserves the previous cursor, so data can be
         written even after calling this method.
         """
 
-        pos = self._data.tell()
-        self._data.seek(0)
-        data = self._data.read()
-        self._data.seek(pos)
-
-        return data
+        return self._data.getvalue()
 
     def write_long_string(self, data: bytes) -> None:
         """
@@ -444,7 +478,7 @@ class EncodingBuffer:
 
         return self._table_cm()
 
-    def write_table(self, table: dict[str, Any]) -> None:
+    def write_table(self, table: Mapping[str, Any]) -> None:
         """
         Writes a complete table.
         """
@@ -505,8 +539,8 @@ class TableWriter(EncodingBuffer):
         elif isinstance(value, datetime):
             self.write_timestamp(value)
 
-        elif isinstance(value, dict):
-            self.write_table(value)  # type: ignore
+        elif isinstance(value, Mapping):
+            self.write_table(cast("Mapping[str, Any]", value))
 
         else:
             raise ValueError(f"Unknown item: {value} ({type(value)})")
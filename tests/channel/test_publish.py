@@ -1,8 +1,10 @@
+import anyio
 import pytest
 from serena.enums import ReplyCode
 from serena.exc import MessageReturnedError
 from serena.message import AMQPMessage
 from serena.payloads.header import BasicHeader
+from serena.payloads.method import BasicAckPayload, BasicNackPayload, MethodPayload
 
 from tests import _open_connection
 
@@ -110,3 +112,111 @@ async def test_return():
             assert channel.open
 
         assert e.value.reply_code == ReplyCode.no_route
+
+
+async def test_publish_after_return():
+    """
+    Tests that publishing straight after a returned message isn't confused by its Ack.
+    """
+
+    async with _open_connection() as conn, conn.open_channel() as channel:
+        queue = await channel.queue_declare(name="", exclusive=True)
+
+        for _ in range(10):
+            with pytest.raises(MessageReturnedError):
+                await channel.basic_publish("", routing_key="non-existent-queue", body=b"")
+
+            await channel.basic_publish("", routing_key=queue.name, body=b"test")
+
+        declared = await channel.queue_declare(name=queue.name, passive=True)
+        assert declared.message_count == 10
+
+
+async def test_basic_publish_many():
+    """
+    Tests publishing several messages in one go.
+    """
+
+    async with _open_connection() as conn, conn.open_channel() as channel:
+        queue = await channel.queue_declare(name="", exclusive=True)
+        headers = BasicHeader(message_id="123456")
+
+        await channel.basic_publish_many(
+            "",
+            [(queue.name, b"first", None), (queue.name, b"second", headers)],
+        )
+        # delivery tags still line up for regular publishes
+        await channel.basic_publish("", routing_key=queue.name, body=b"third")
+
+        bodies: list[bytes] = []
+        while (message := await channel.basic_get(queue.name, no_ack=True)) is not None:
+            bodies.append(message.body)
+            if message.body == b"second":
+                assert message.header == headers
+
+        assert bodies == [b"first", b"second", b"third"]
+
+
+async def test_basic_publish_many_return():
+    """
+    Tests that a returned message in a batch is raised once the whole batch is confirmed.
+    """
+
+    async with _open_connection() as conn:
+        async with conn.open_channel() as channel:
+            queue = await channel.queue_declare(name="", exclusive=True)
+
+            with pytest.raises(MessageReturnedError) as e:
+                await channel.basic_publish_many(
+                    "",
+                    [("non-existent-queue", b"", None), (queue.name, b"test", None)],
+                )
+
+            assert channel.open
+            declared = await channel.queue_declare(name=queue.name, passive=True)
+            assert declared.message_count == 1
+
+        assert e.value.reply_code == ReplyCode.no_route
+
+
+async def test_basic_publish_many_return_overflow():
+    """
+    Tests that the content of returned messages doesn't fill up the delivery buffer, even when a
+    batch returns more messages than it can hold.
+    """
+
+    async with _open_connection() as conn, conn.open_channel() as channel:
+        queue = await channel.queue_declare(name="", exclusive=True)
+        count = conn._channel_buffer_size // 2 + 10
+
+        with anyio.fail_after(5):
+            with pytest.raises(MessageReturnedError):
+                await channel.basic_publish_many(
+                    "", [("non-existent-queue", b"test", None)] * count
+                )
+
+            # the returned headers and bodies aren't left in front of this one
+            await channel.basic_publish("", routing_key=queue.name, body=b"delivered")
+            message = await channel.basic_get(queue.name, no_ack=True)
+
+        assert message is not None
+        assert message.body == b"delivered"
+
+
+async def test_out_of_order_confirms():
+    """
+    Tests waiting for a batch of confirmations that arrive out of order and partly grouped.
+    """
+
+    async with _open_connection() as conn, conn.open_channel() as channel:
+        send, receive = anyio.create_memory_object_stream[MethodPayload](5)
+        send.send_nowait(BasicAckPayload(delivery_tag=13, multiple=False))
+        send.send_nowait(BasicAckPayload(delivery_tag=11, multiple=False))
+        send.send_nowait(BasicNackPayload(delivery_tag=14, multiple=True, requeue=False))
+        send.send_nowait(BasicAckPayload(delivery_tag=15, multiple=False))
+
+        with send, receive, anyio.fail_after(1):
+            failure = await channel._receive_confirms(receive, 11, 15)
+
+        assert isinstance(failure, BasicNackPayload)
+        assert failure.delivery_tag == 14
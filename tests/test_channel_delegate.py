@@ -0,0 +1,59 @@
+import pytest
+from serena import ChannelDelegate
+from serena.message import AMQPMessage
+from serena.mixin import (
+    _DEFINITELY_DELEGATED_METHODS,
+    _DELEGATED_METHODS,
+    DefinitelyChannelDelegate,
+)
+from typing_extensions import override
+
+from tests import _open_connection
+
+pytestmark = pytest.mark.anyio
+
+
+class _NoGetDelegate(DefinitelyChannelDelegate):
+    @override
+    async def basic_get(self, queue: str, *, no_ack: bool = False) -> AMQPMessage | None:
+        return None
+
+    @override
+    async def basic_ack(self, delivery_tag: int, *, multiple: bool = False) -> None:
+        raise RuntimeError("overridden")
+
+
+async def test_delegate_binds_channel_methods():
+    """
+    Tests that a delegate's methods are the wrapped channel's own bound methods.
+    """
+
+    async with _open_connection() as conn, conn.open_channel() as channel:
+        delegate = ChannelDelegate(channel)
+        for name in _DELEGATED_METHODS:
+            assert getattr(delegate, name) == getattr(channel, name)
+
+        definitely = DefinitelyChannelDelegate(channel)
+        for name in _DELEGATED_METHODS + _DEFINITELY_DELEGATED_METHODS:
+            assert getattr(definitely, name) == getattr(channel, name)
+
+
+async def test_delegate_keeps_overrides():
+    """
+    Tests that methods overridden by a delegate subclass aren't replaced by the channel's.
+    """
+
+    async with _open_connection() as conn, conn.open_channel() as channel:
+        queue = await channel.queue_declare(name="", exclusive=True)
+        await channel.basic_publish("", routing_key=queue.name, body=b"test")
+
+        delegate = _NoGetDelegate(channel)
+        assert delegate.basic_get.__func__ is _NoGetDelegate.basic_get  # type: ignore
+        assert await delegate.basic_get(queue.name) is None
+
+        with pytest.raises(RuntimeError):
+            await delegate.basic_ack(1)
+
+        # everything else still goes straight to the channel
+        assert delegate.basic_publish == channel.basic_publish
+        assert delegate.basic_nack == channel.basic_nack
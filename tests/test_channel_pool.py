@@ -64,3 +64,25 @@ async def test_channel_pool_errors():
         # random sleep to make sure the background worker has time to enqueue the next channel
         await anyio.sleep(2)
         assert pool.idle_channels == 2
+
+
+@pytest.mark.slow
+async def test_channel_pool_replaces_concurrent_errors():
+    """
+    Tests that every channel lost at the same time is replaced in the channel pool.
+    """
+
+    async def _fail() -> None:
+        with pytest.raises(UnexpectedCloseError):
+            await pool.basic_publish("abcdef", routing_key="", body=b"")
+
+    async with (
+        _open_connection() as conn,
+        conn.open_channel_pool(initial_channels=2) as pool,
+    ):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_fail)
+            tg.start_soon(_fail)
+
+        await anyio.sleep(2)
+        assert pool.idle_channels == 2
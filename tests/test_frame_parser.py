@@ -1,5 +1,7 @@
+from serena.frame import BodyFrame
 from serena.frameparser import NEED_DATA, FrameParser
-from serena.payloads.method import MethodFrame
+from serena.payloads.header import BasicHeader
+from serena.payloads.method import BasicPublishPayload, MethodFrame
 
 data = (
     b"\x01\x00\x00\x00\x00\x02\x01\x00\n\x00\n\x00\t\x00\x00\x01\xdc\x0ccapabilitiesF\x00\x00\x00"
@@ -70,3 +72,67 @@ def test_overrunning_with_partial_frame():
     assert parser.next_frame() == NEED_DATA
     parser.receive_data(data[150:])
     assert isinstance(parser.next_frame(), MethodFrame)
+
+
+def test_partial_body_frame():
+    """
+    Tests that a body frame received in several chunks doesn't keep its frame-end octet.
+    """
+
+    body = b"x" * 250
+    (frame_data,) = FrameParser.write_body_frames(1, body, max_frame_size=1000)
+
+    parser = FrameParser()
+    parser.receive_data(frame_data[:100])
+    assert parser.next_frame() == NEED_DATA
+    parser.receive_data(frame_data[100:200])
+    assert parser.next_frame() == NEED_DATA
+    parser.receive_data(frame_data[200:])
+
+    frame = parser.next_frame()
+    assert isinstance(frame, BodyFrame)
+    assert frame.data == body
+
+
+def test_publish_frames_match_individual_frames():
+    """
+    Tests that the combined publish buffer is the same as writing each frame separately.
+    """
+
+    payload = BasicPublishPayload(
+        reserved_1=1, name="amq.direct", routing_key="test", mandatory=True, immediate=False
+    )
+    header = BasicHeader(message_id="abc")
+    body = b"x" * 250
+
+    expected = b"".join(
+        [
+            FrameParser.write_method_frame(1, payload),
+            FrameParser.write_header_frame(1, payload.klass, len(body), header),
+            *FrameParser.write_body_frames(1, body, max_frame_size=100),
+        ]
+    )
+    method_frame = FrameParser.write_method_frame(1, payload)
+    result = FrameParser.write_publish_frames(1, [(method_frame, header, body)], max_frame_size=100)
+    assert result == expected
+
+
+def test_publish_frames_batch():
+    """
+    Tests that writing several messages into one buffer is the same as writing each one separately.
+    """
+
+    payload = BasicPublishPayload(
+        reserved_1=1, name="amq.direct", routing_key="test", mandatory=True, immediate=False
+    )
+    method_frame = FrameParser.write_method_frame(1, payload)
+    messages = [
+        (method_frame, BasicHeader(message_id="abc"), b"x" * 250),
+        (method_frame, BasicHeader(), b""),
+        (method_frame, BasicHeader(content_type="text/plain"), b"y" * 100),
+    ]
+
+    expected = b"".join(
+        FrameParser.write_publish_frames(1, [message], max_frame_size=100) for message in messages
+    )
+    assert FrameParser.write_publish_frames(1, messages, max_frame_size=100) == expected
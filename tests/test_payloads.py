@@ -0,0 +1,259 @@
+from types import MappingProxyType
+
+import attr
+import pytest
+from serena.enums import ReplyCode
+from serena.payloads import method
+from serena.payloads.encoding import (
+    build_decoder,
+    build_encoder,
+    decode_attrs_attribute,
+    encode_attrs_attribute,
+    resolved_fields,
+)
+from serena.payloads.method import (
+    _PAYLOAD_BY_ID,
+    BasicAckPayload,
+    BasicDeliverPayload,
+    ChannelCloseOkPayload,
+    ChannelClosePayload,
+    ConnectionTunePayload,
+    MethodPayload,
+    QueueDeclarePayload,
+    deserialise_payload,
+    serialise_payload,
+)
+from serena.utils.buffer import DecodingBuffer, EncodingBuffer
+
+
+def _all_payload_types() -> list[type[MethodPayload]]:
+    return [
+        klass
+        for klass in vars(method).values()
+        if isinstance(klass, type) and issubclass(klass, MethodPayload) and hasattr(klass, "method")
+    ]
+
+
+def test_every_payload_is_registered():
+    """
+    Tests that every payload class can be looked up by its class and method ID.
+    """
+
+    for klass in _all_payload_types():
+        assert _PAYLOAD_BY_ID[(klass.klass << 16) | klass.method] is klass
+
+
+def test_payloads_are_slotted():
+    """
+    Tests that every payload class is a slotted attrs class, so instances don't get a ``__dict__``.
+    """
+
+    for klass in _all_payload_types():
+        assert attr.has(klass), klass
+        assert "__slots__" in vars(klass), klass
+        assert "__dict__" not in dir(klass), klass
+
+
+def test_round_trip():
+    """
+    Tests deserialising a serialised payload.
+    """
+
+    payload = BasicAckPayload(delivery_tag=12345, multiple=False)
+    assert deserialise_payload(serialise_payload(payload)) == payload
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        QueueDeclarePayload(
+            reserved_1=0,
+            name="test-queue",
+            passive=True,
+            durable=True,
+            exclusive=False,
+            auto_delete=False,
+            no_wait=False,
+            arguments={"x-max-length": 10},
+        ),
+        ConnectionTunePayload(max_channels=2047, max_frame_size=131072, heartbeat_delay=60),
+    ],
+)
+def test_generated_encoder_matches_fields(payload: MethodPayload):
+    """
+    Tests that the generated encoder writes the same data as encoding each field one by one.
+    """
+
+    expected = EncodingBuffer()
+    for field in resolved_fields(type(payload)):
+        encode_attrs_attribute(expected, field, getattr(payload, field.name))
+    expected.force_write_bits()
+
+    result = EncodingBuffer()
+    # generated encoders never leave bits pending, so there's no need to flush them
+    build_encoder(type(payload))(payload, result)
+
+    assert result.get_data() == expected.get_data()
+
+
+def test_read_only_arguments():
+    """
+    Tests that read-only mappings are encoded the same as dicts for table fields.
+    """
+
+    payload = QueueDeclarePayload(
+        reserved_1=0,
+        name="test-queue",
+        passive=False,
+        durable=True,
+        exclusive=False,
+        auto_delete=False,
+        no_wait=False,
+        arguments={"x-max-length": 10, "x-args": {"nested": True}},
+    )
+    read_only = attr.evolve(
+        payload,
+        arguments=MappingProxyType(
+            {"x-max-length": 10, "x-args": MappingProxyType({"nested": True})}
+        ),
+    )
+
+    assert serialise_payload(read_only) == serialise_payload(payload)
+    assert serialise_payload(attr.evolve(payload, arguments=MappingProxyType({}))) == (
+        serialise_payload(attr.evolve(payload, arguments={}))
+    )
+
+
+def test_generated_decoder_matches_fields():
+    """
+    Tests that the generated decoder reads the same data as decoding each field one by one.
+    """
+
+    payload = ConnectionTunePayload(max_channels=2047, max_frame_size=131072, heartbeat_delay=60)
+    data = serialise_payload(payload)[4:]
+
+    buffer = DecodingBuffer(data)
+    expected = ConnectionTunePayload(
+        **{
+            field.name: decode_attrs_attribute(buffer, field)
+            for field in resolved_fields(ConnectionTunePayload)
+        }
+    )
+
+    assert build_decoder(ConnectionTunePayload)(DecodingBuffer(data)) == expected == payload
+
+
+def test_empty_payloads_are_shared():
+    """
+    Tests that decoding a payload without any fields returns the same instance every time.
+    """
+
+    data = serialise_payload(ChannelCloseOkPayload())
+    decoded = deserialise_payload(data)
+
+    assert decoded == ChannelCloseOkPayload()
+    assert deserialise_payload(data) is decoded
+
+
+def test_round_trip_strings():
+    """
+    Tests deserialising a serialised payload with string fields.
+    """
+
+    payload = BasicDeliverPayload(
+        consumer_tag="amq.ctag-1",
+        delivery_tag=2**40,
+        redelivered=True,
+        exchange_name="amq.direct",
+        routing_key="some.routing.key",
+    )
+    assert deserialise_payload(serialise_payload(payload)) == payload
+
+
+@pytest.mark.parametrize(
+    ("flags", "octet"),
+    [
+        ({"passive": True}, 0b00001),
+        ({"no_wait": True}, 0b10000),
+        ({"durable": True, "exclusive": True}, 0b00110),
+        ({"passive": True, "exclusive": True, "no_wait": True}, 0b10101),
+    ],
+)
+def test_round_trip_bits(flags: dict[str, bool], octet: int):
+    """
+    Tests that every bit in a packed run of bits survives a round trip, and that the bits are
+    packed in protocol order.
+    """
+
+    payload = QueueDeclarePayload(
+        reserved_1=0,
+        name="test-queue",
+        passive=False,
+        durable=False,
+        exclusive=False,
+        auto_delete=False,
+        no_wait=False,
+        arguments={},
+    )
+    payload = attr.evolve(payload, **flags)
+    data = serialise_payload(payload)
+
+    # passive is the first bit on the wire, so it's the lowest bit of the octet
+    assert data[4 + 2 + 1 + len("test-queue")] == octet
+    assert deserialise_payload(data) == payload
+
+
+def test_bit_fields_need_generated_decoder():
+    """
+    Tests that decoding a lone bit field is refused, as its position depends on the rest of its run.
+    """
+
+    field = next(it for it in resolved_fields(QueueDeclarePayload) if it.name == "passive")
+    with pytest.raises(NotImplementedError):
+        decode_attrs_attribute(DecodingBuffer(b"\x01"), field)
+
+
+def test_delivery_strings_are_interned():
+    """
+    Tests that repeated delivery strings decode to the same string objects.
+    """
+
+    first, second = (
+        deserialise_payload(
+            serialise_payload(
+                BasicDeliverPayload(
+                    consumer_tag="amq.ctag-interned",
+                    delivery_tag=tag,
+                    redelivered=False,
+                    exchange_name="amq.direct",
+                    routing_key="some.routing.key",
+                )
+            )
+        )
+        for tag in (1, 2)
+    )
+
+    assert isinstance(first, BasicDeliverPayload)
+    assert isinstance(second, BasicDeliverPayload)
+    assert first.consumer_tag is second.consumer_tag
+    assert first.routing_key is second.routing_key
+    assert first.delivery_tag != second.delivery_tag
+
+
+def test_decoded_payloads_are_complete():
+    """
+    Tests that decoded payloads still behave like normally constructed ones.
+    """
+
+    payload = ChannelClosePayload(
+        reply_code=ReplyCode.not_found, reply_text="NOT_FOUND", class_id=50, method_id=10
+    )
+    decoded = deserialise_payload(serialise_payload(payload))
+
+    assert decoded == payload
+    assert hash(decoded) == hash(payload)
+    # converters are still applied
+    assert type(decoded.reply_code) is ReplyCode
+
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        decoded.reply_text = "something else"  # type: ignore